@@ -5,99 +5,263 @@ PDF Outline Extractor
 A lightweight, rule-based extractor that takes a PDF and produces a JSON outline
 containing the document title and headings with their respective page numbers.
 """
+import io
+import os
 import sys
 import json
 import re
+import queue
 import argparse
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 
-try:
-    from PyPDF2 import PdfReader
-except ImportError:
-    print("PyPDF2 not found. Please install: pip install PyPDF2", file=sys.stderr)
-    sys.exit(1)
+if TYPE_CHECKING:
+    import fitz
 
 try:
-    from pdfminer.high_level import extract_text
+    import orjson
 except ImportError:
-    print("pdfminer.six not found. Please install: pip install pdfminer.six", file=sys.stderr)
-    sys.exit(1)
+    orjson = None
+
+
+# Character sets for heading classification
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_UP_CHARS = _UPPER + "0123456789. "  # "BACKGROUND", "RESULTS AND DISCUSSION"
+_TITLE_CHARS = _UPPER + _UPPER.lower() + "0123456789 ,-:"  # "Experimental Setup"
+
+# Patterns to filter out noise (dates, footers, etc.), fused into one regex
+_NOISE_RE = re.compile("|".join(f"(?:{p})" for p in (
+    r"^\d{1,2}[-/]\d{1,2}[-/]\d{2,4}$",
+    r"^\d{4}[-/]\d{1,2}[-/]\d{1,2}$",
+    r"(?i:^page\s+\d+$)",
+    r"(?i:^copyright.*$)",
+    r"^\d+$",
+    r"^[^\w\s]+$",
+)))
+
+# A line holding only a section number ("1.", "2.1"), which PyMuPDF emits
+# separately from the heading text that follows it
+_SECTION_NUM_RE = re.compile(r"^\d+(\.\d+)*\.?$")
+
+# Final characters that suggest a line is part of a sentence
+_SENT_END = frozenset('.,;!?')
+
+# Maps ASCII lowercase letters to 1 and every other byte to 0, for counting in C
+_LOWER_TABLE = bytes(1 if ord('a') <= i <= ord('z') else 0 for i in range(256))
+
+
+def _classify(line: str) -> Optional[str]:
+    """Classify a stripped line as an H1, H2 or H3 heading, or None if it is not one.
+    
+    Hand-rolled equivalent of matching the uppercase, numbered ("2.1 Methodology")
+    and title case patterns; only the leading section number is scanned in Python,
+    the character-set tests run in C via str.strip.
+    """
+    n = len(line)
+    
+    # Leading section number: digits, then "." or whitespace
+    i = 0
+    while i < n and line[i].isdecimal():
+        i += 1
+    h1_num = 0 < i < n - 1 and line[i] == '.' and line[i + 1].isspace()
+    
+    # Uppercase: only A-Z, 0-9, "." and " ", with at least one letter.
+    # Checked first as lines such as "2020 REPORT" are also numbered.
+    if not line.strip(_UP_CHARS) and line.strip("0123456789. "):
+        # H1 when long or a major numbered section, H2 otherwise
+        return "H1" if n > 15 or h1_num else "H2"
+    
+    # Numbered: "1. Introduction", "2.1 Methodology", "1.1.1 Details"
+    if 0 < i < n - 1 and (line[i] == '.' or line[i].isspace()):
+        # H1: Major numbered sections (1., 2., 3.)
+        if h1_num:
+            return "H1"
+        # H2: Subsections (1.1, 2.1)
+        if line[i] == '.':
+            j = i + 1
+            while j < n and line[j].isdecimal():
+                j += 1
+            if i + 1 < j < n and line[j].isspace():
+                return "H2"
+        # H3: Sub-subsections (1.1.1) or other patterns
+        return "H3"
+    
+    # Title case: an uppercase letter followed by at least four title characters
+    if n >= 5 and line[0] in _UPPER and not line.strip(_TITLE_CHARS):
+        return "H2"
+    
+    return None
+
+
+def _is_candidate(line: str) -> bool:
+    """Cheap scalar checks on a stripped line, rejecting most body text before any regex runs."""
+    n = len(line)
+    
+    # Skip if it's too short (noise) or too long (likely content text)
+    if n < 3 or n > 100:
+        return False
+    
+    # Skip if it can't start a numbered, uppercase or title case heading
+    c0 = line[0]
+    if not (c0.isdigit() or c0.isupper() or c0 == '.'):
+        return False
+    
+    # Skip if it ends with punctuation that suggests it's part of a sentence
+    return not (line[-1] in _SENT_END and line[-3:] != '...')
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split page text into stripped, non-empty lines."""
+    return [ln for ln in (s.strip() for s in text.splitlines()) if ln]
+
+
+def _join_section_numbers(lines: List[str]) -> List[str]:
+    """Join lines that are only a section number onto the heading text that follows.
+    
+    Runs of numbers (page numbers in a table of contents, "2.1" after "7") are
+    left alone so that only the last number is joined to the text.
+    """
+    joined = []
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i]
+        if i + 1 < n and _SECTION_NUM_RE.match(line) and not _SECTION_NUM_RE.match(lines[i + 1]):
+            line = f"{line} {lines[i + 1]}"
+            i += 1
+        joined.append(line)
+        i += 1
+    return joined
 
 
 class PDFOutlineExtractor:
     """PDF outline extractor using rule-based pattern matching."""
     
+    __slots__ = ('_title_keys',)
+    
     def __init__(self):
-        # Regex patterns for heading detection
-        self.num_pat = re.compile(r"^\d+(\.\d+)*[\.\s]+.+")  # "1. Introduction", "2.1 Methodology"
-        self.up_pat = re.compile(r"^(?=.*[A-Z])[A-Z0-9. ]+$")  # "BACKGROUND", "RESULTS AND DISCUSSION"
-        self.title_pat = re.compile(r"^[A-Z][a-zA-Z0-9 ,\-\:]{4,}$")  # "Experimental Setup"
+        # Case-folded detected title, to filter it out from headings
+        self._title_keys = frozenset()
+    
+    def _load(self, pdf_path: str,
+              data: Optional[bytes] = None) -> Tuple[List[Dict[str, any]], List[Tuple[List[str], int]], Optional[str]]:
+        """Read a PDF once, returns (embedded outline headings, [(lines, page_number)], metadata title).
+        
+        The file is read from pdf_path unless its contents are passed as data.
+        """
+        if data is None:
+            data = Path(pdf_path).read_bytes()
+        toc_headings, pages_text, title = [], [], None
+        
+        # PDF libraries are imported on first use to keep start-up fast
+        try:
+            import fitz
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                # Use the embedded outline when there is one, skipping heading detection
+                toc_headings = self.extract_outline_from_toc(doc)
+                title = self.extract_title_from_metadata(doc)
+                
+                if toc_headings:
+                    # With an embedded outline the text is only needed for the title,
+                    # so only the first page is read
+                    pages_text = self.extract_text_fitz(doc, max_pages=1)
+                    
+                    # Drop the title from the outline; a cover-page bookmark for the
+                    # title alone leaves nothing, so fall back to heading detection
+                    key = (title or self.extract_title_from_content(pages_text)).casefold()
+                    toc_headings = [h for h in toc_headings if h["text"].casefold() != key]
+                
+                if not toc_headings:
+                    pages_text = self.extract_text_fitz(doc)
+        except ImportError:
+            print("PyMuPDF not found. Please install: pip install PyMuPDF", file=sys.stderr)
+        except Exception as e:
+            print(f"PyMuPDF could not open PDF: {e}", file=sys.stderr)
         
-        # Patterns to filter out noise (dates, footers, etc.)
-        self.noise_patterns = [
-            re.compile(r"^\d{1,2}[-/]\d{1,2}[-/]\d{2,4}$"),
-            re.compile(r"^\d{4}[-/]\d{1,2}[-/]\d{1,2}$"),
-            re.compile(r"^page\s+\d+$", re.IGNORECASE),
-            re.compile(r"^copyright.*$", re.IGNORECASE),
-            re.compile(r"^\d+$"),
-            re.compile(r"^[^\w\s]+$"),
-        ]
+        # If PyMuPDF fails or returns empty, use pdfminer as fallback. Not worth a
+        # full parse when the embedded outline already supplies the headings.
+        if not pages_text and not toc_headings:
+            print("PyMuPDF failed, trying pdfminer...", file=sys.stderr)
+            pages_text = self.extract_text_pdfminer(io.BytesIO(data))
         
-        # Store detected title to filter it out from headings
-        self._detected_title = None
+        return toc_headings, pages_text, title
     
-    def extract_text_pypdf2(self, pdf_path: str) -> List[Tuple[str, int]]:
-        """Extract text using PyPDF2, returns list of (text, page_number) tuples."""
+    def extract_text_fitz(self, doc: "fitz.Document",
+                          max_pages: Optional[int] = None) -> List[Tuple[List[str], int]]:
+        """Extract lines from an open PDF using PyMuPDF, returns list of (lines, page_number) tuples.
+        
+        Only the first max_pages pages are read, if given.
+        """
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                pages_text = []
-                for page_num, page in enumerate(reader.pages, 1):
-                    text = page.extract_text()
-                    if text.strip():
-                        pages_text.append((text, page_num))
-                return pages_text
+            pages_text = []
+            for page_num, page in enumerate(doc, 1):
+                if max_pages and page_num > max_pages:
+                    break
+                lines = _join_section_numbers(_split_lines(page.get_text("text")))
+                if lines:
+                    pages_text.append((lines, page_num))
+            return pages_text
         except Exception as e:
-            print(f"PyPDF2 extraction failed: {e}", file=sys.stderr)
+            print(f"PyMuPDF extraction failed: {e}", file=sys.stderr)
             return []
     
-    def extract_text_pdfminer(self, pdf_path: str) -> List[Tuple[str, int]]:
-        """Extract text using pdfminer as fallback, returns list of (text, page_number) tuples."""
+    def extract_text_pdfminer(self, pdf_file: BinaryIO) -> List[Tuple[List[str], int]]:
+        """Extract lines using pdfminer as fallback, returns list of (lines, page_number) tuples."""
         try:
-            full_text = extract_text(pdf_path)
+            from pdfminer.high_level import extract_text
+            full_text = extract_text(pdf_file)
             # Split by form feed character to separate pages
             pages = full_text.split('\x0c')
             pages_text = []
             for page_num, page_text in enumerate(pages, 1):
-                if page_text.strip():
-                    pages_text.append((page_text, page_num))
+                lines = _split_lines(page_text)
+                if lines:
+                    pages_text.append((lines, page_num))
             return pages_text
+        except ImportError:
+            print("pdfminer.six not found. Please install: pip install pdfminer.six", file=sys.stderr)
+            return []
         except Exception as e:
             print(f"pdfminer extraction failed: {e}", file=sys.stderr)
             return []
     
-    def extract_title_from_metadata(self, pdf_path: str) -> Optional[str]:
-        """Extract title from PDF metadata."""
+    def extract_outline_from_toc(self, doc: "fitz.Document") -> List[Dict[str, any]]:
+        """Extract headings from an open PDF's embedded outline (bookmarks), if it has one."""
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                if reader.metadata and reader.metadata.title:
-                    title = reader.metadata.title.strip()
-                    if title and len(title) > 2:
-                        return title
+            toc = doc.get_toc()
         except Exception as e:
-            print(f"Metadata extraction failed: {e}", file=sys.stderr)
+            print(f"Embedded outline extraction failed: {e}", file=sys.stderr)
+            return []
+        
+        headings = []
+        for level, text, page_num in toc:
+            text = text.strip()
+            # Skip empty entries and bookmarks that don't point at a page
+            if text and page_num >= 1:
+                headings.append({
+                    "level": f"H{min(level, 3)}",
+                    "text": text,
+                    "page": page_num
+                })
+        
+        return headings
+    
+    def extract_title_from_metadata(self, doc: "fitz.Document") -> Optional[str]:
+        """Extract title from the metadata of an already open PDF."""
+        title = (doc.metadata or {}).get("title")
+        if title:
+            title = title.strip()
+            if title and len(title) > 2:
+                return title
         
         return None
     
-    def extract_title_from_content(self, pages_text: List[Tuple[str, int]]) -> str:
+    def extract_title_from_content(self, pages_text: List[Tuple[List[str], int]]) -> str:
         """Extract title from document content (first non-blank line)."""
-        for text, _ in pages_text:
-            lines = text.split('\n')
+        for lines, _ in pages_text:
             for line in lines:
-                line = line.strip()
-                if line and len(line) > 3 and not self.is_noise(line):
+                if len(line) > 3 and not self.is_noise(line):
                     return line
         
         return "Untitled Document"
@@ -108,110 +272,102 @@ class PDFOutlineExtractor:
         if len(line) < 3:
             return True
         
-        for pattern in self.noise_patterns:
-            if pattern.match(line):
-                return True
-        
-        return False
+        return _NOISE_RE.match(line) is not None
     
     def is_heading(self, line: str) -> bool:
         """Check if a line matches heading patterns."""
+        return self.classify_heading(line) is not None
+    
+    def classify_heading(self, line: str) -> Optional[str]:
+        """Return the heading level (H1, H2, H3) of a line, or None if it is not a heading."""
         line = line.strip()
+        if not _is_candidate(line):
+            return None
+        
+        return self._classify_candidate(line)
+    
+    def _classify_candidate(self, line: str) -> Optional[str]:
+        """Classify a stripped line that already passed _is_candidate."""
+        n = len(line)
         
         # Skip if it's noise
-        if self.is_noise(line):
-            return False
+        if _NOISE_RE.match(line):
+            return None
         
         # Skip if it's the document title
-        if hasattr(self, '_detected_title') and self._detected_title and line == self._detected_title:
-            return False
-        
-        # Skip if it's too long (likely content text)
-        if len(line) > 100:
-            return False
+        if line.casefold() in self._title_keys:
+            return None
         
         # Skip if it contains repeated phrases (indicates wrapped content)
         if '. This is the content for section:' in line:
-            return False
+            return None
         
         # Skip if it contains too much lowercase text (likely content)
-        if len(line) > 50 and sum(1 for c in line if c.islower()) > len(line) * 0.7:
-            return False
+        if n > 50:
+            if line.isascii():
+                n_lower = line.encode('ascii').translate(_LOWER_TABLE).count(1)
+            else:
+                n_lower = sum(map(str.islower, line))
+            if n_lower > n * 0.7:
+                return None
         
-        # Skip if it ends with punctuation that suggests it's part of a sentence
-        if line.endswith(('.', ',', ';', '!', '?')) and not line.endswith('...'):
-            return False
-        
-        # Check numbered headings
-        if self.num_pat.match(line):
-            return True
-        
-        # Check uppercase headings (but not too long)
-        if len(line) <= 100 and self.up_pat.match(line):
-            return True
-        
-        # Check title case headings
-        if self.title_pat.match(line):
-            return True
-
-        return False
+        # Check uppercase, numbered and title case headings in one pass
+        return _classify(line)
     
-    def extract_headings(self, pages_text: List[Tuple[str, int]]) -> List[Dict[str, any]]:
-        """Extract headings from all pages."""
+    def extract_headings(self, pages_text: List[Tuple[List[str], int]]) -> List[Dict[str, any]]:
+        """Extract headings from all pages, keeping only the first occurrence of repeated ones."""
         headings = []
+        # Running headers repeat on every page; key on case-insensitive text
+        seen = set()
+        # Repeated lines (headers, footers, page furniture) are classified once
+        rejected = set()
         
-        for text, page_num in pages_text:
-            lines = text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if self.is_heading(line):
-                    level = self.determine_heading_level(line)
-                    headings.append({
+        # Bind per-line lookups to locals outside the hot loop
+        classify = self._classify_candidate
+        add_heading = headings.append
+        
+        for lines, page_num in pages_text:
+            # Run the cheap scalar checks over the whole page first, so only
+            # surviving lines reach the classifier
+            for line in filter(_is_candidate, lines):
+                if line in rejected:
+                    continue
+                key = line.casefold()
+                if key in seen:
+                    continue
+                level = classify(line)
+                if level:
+                    seen.add(key)
+                    add_heading({
                         "level": level,
                         "text": line,
                         "page": page_num
                     })
+                else:
+                    rejected.add(line)
         
         return headings
     
     def determine_heading_level(self, line: str) -> str:
         """Determine the heading level (H1, H2, H3) based on patterns."""
-        line = line.strip()
-        
-        # H1: Major numbered sections (1., 2., 3.) or long uppercase
-        if re.match(r"^\d+\.\s+", line) or (len(line) > 15 and self.up_pat.match(line)):
-            return "H1"
-        
-        # H2: Subsections (1.1, 2.1) or short uppercase or title case
-        elif re.match(r"^\d+\.\d+\s+", line) or (len(line) <= 15 and self.up_pat.match(line)) or self.title_pat.match(line):
-            return "H2"
-        
-        # H3: Sub-subsections (1.1.1) or other patterns
-        else:
-            return "H3"
+        return _classify(line.strip()) or "H3"
     
-    def extract_outline(self, pdf_path: str) -> Dict[str, any]:
-        """Extract complete outline from PDF."""
-        # Try to extract text using PyPDF2 first
-        pages_text = self.extract_text_pypdf2(pdf_path)
-        
-        # If PyPDF2 fails or returns empty, use pdfminer as fallback
-        if not pages_text:
-            print("PyPDF2 failed, trying pdfminer...", file=sys.stderr)
-            pages_text = self.extract_text_pdfminer(pdf_path)
+    def extract_outline(self, pdf_path: str, data: Optional[bytes] = None) -> Dict[str, any]:
+        """Extract complete outline from PDF, optionally from its already read contents."""
+        # Open the PDF once for the embedded outline, text and metadata title
+        toc_headings, pages_text, title = self._load(pdf_path, data)
         
-        if not pages_text:
+        if not pages_text and not toc_headings:
             raise ValueError("Could not extract text from PDF")
         
-        # Extract title
-        title = self.extract_title_from_metadata(pdf_path)
+        # Extract title, preferring the metadata read alongside the text
         if not title:
             title = self.extract_title_from_content(pages_text)
         
-        self._detected_title = title
+        self._title_keys = frozenset({title.casefold()})
         
-        # Extract headings
-        headings = self.extract_headings(pages_text)
+        # Extract headings; the embedded outline already excludes the title
+        headings = toc_headings or self.extract_headings(pages_text)
         
         return {
             "title": title,
@@ -219,6 +375,68 @@ class PDFOutlineExtractor:
         }
 
 
+def save_outline(outline: Dict[str, any], output_path: Path, pretty: bool = False) -> None:
+    """Save an outline as JSON, compact unless pretty is set."""
+    # orjson encodes straight to UTF-8 bytes, written with a single call
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(outline, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+    
+    # json.dumps without indent uses the C encoder; json.dump never does
+    if pretty:
+        data = json.dumps(outline, indent=2, ensure_ascii=False)
+    else:
+        data = json.dumps(outline, ensure_ascii=False, separators=(',', ':'))
+    
+    output_path.write_bytes(data.encode('utf-8'))
+
+
+def _process_one(pdf_path_str: str, output_dir_str: str, pretty: bool = False,
+                 data: Optional[bytes] = None) -> Tuple[bool, str]:
+    """Extract the outline of one PDF into output_dir, returns (success, file name)."""
+    pdf_path = Path(pdf_path_str)
+    try:
+        print(f"Processing: {pdf_path.name}", flush=True)
+        outline = PDFOutlineExtractor().extract_outline(str(pdf_path), data)
+        
+        # Generate output filename
+        output_filename = pdf_path.stem + ".json"
+        output_path = Path(output_dir_str) / output_filename
+        
+        # Save outline to JSON
+        save_outline(outline, output_path, pretty)
+        
+        print(f"✓ Generated: {output_filename}", flush=True)
+        return True, pdf_path.name
+        
+    except Exception as e:
+        print(f"✗ Failed to process {pdf_path.name}: {e}", file=sys.stderr, flush=True)
+        return False, pdf_path.name
+
+
+def _read_ahead(pdf_files: List[Path], maxsize: int = 8) -> Iterator[Tuple[Path, Optional[bytes]]]:
+    """Yield (path, contents) for each PDF, reading the files on a background thread.
+    
+    The bounded queue lets reading upcoming files overlap with processing the
+    current one while capping how many are held in memory. Contents are None if
+    a file could not be read for any reason, leaving the error to be reported by
+    the consumer; every file is always queued so the consumer never blocks forever.
+    """
+    files = queue.Queue(maxsize=maxsize)
+    
+    def reader():
+        for pdf_path in pdf_files:
+            try:
+                data = pdf_path.read_bytes()
+            except BaseException:
+                data = None
+            files.put((pdf_path, data))
+    
+    threading.Thread(target=reader, daemon=True).start()
+    for _ in pdf_files:
+        yield files.get()
+
+
 def main():
     """Main function for batch processing PDFs from input directory."""
     # For backward compatibility, check if CLI arguments are provided
@@ -226,6 +444,9 @@ def main():
         main_cli()
         return
     
+    # Pretty-printed JSON is opt-in; compact output is faster to encode
+    pretty = '--pretty' in sys.argv
+    
     # Batch processing mode for Docker container
     input_dir = Path("/app/input")
     output_dir = Path("/app/output")
@@ -244,29 +465,42 @@ def main():
         print("No PDF files found in input directory!", file=sys.stderr)
         sys.exit(1)
     
-    print(f"Found {len(pdf_files)} PDF file(s) to process")
+    print(f"Found {len(pdf_files)} PDF file(s) to process", flush=True)
     
-    extractor = PDFOutlineExtractor()
+    # Each PDF is an independent CPU-bound job, so spread them across the cores
+    # this process may run on (affinity, not the host's CPU count)
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    workers = min(len(pdf_files), cpus)
+    chunksize = max(1, len(pdf_files) // (4 * workers))
     success_count = 0
     
-    for pdf_path in pdf_files:
-        try:
-            print(f"Processing: {pdf_path.name}")
-            outline = extractor.extract_outline(str(pdf_path))
-            
-            # Generate output filename
-            output_filename = pdf_path.stem + ".json"
-            output_path = output_dir / output_filename
-            
-            # Save outline to JSON
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(outline, f, indent=2, ensure_ascii=False)
-            
-            print(f"✓ Generated: {output_filename}")
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _process_one,
+                [str(p) for p in pdf_files],
+                [str(output_dir)] * len(pdf_files),
+                [pretty] * len(pdf_files),
+                chunksize=chunksize,
+            )
+            for ok, _ in results:
+                if ok:
+                    success_count += 1
+    elif len(pdf_files) > 1:
+        # On a single core, overlap reading upcoming files with processing instead.
+        # MuPDF isn't thread-safe, so only file I/O moves to the reader thread.
+        for pdf_path, data in _read_ahead(pdf_files):
+            ok, _ = _process_one(str(pdf_path), str(output_dir), pretty, data)
+            if ok:
+                success_count += 1
+    else:
+        # A single file has nothing to overlap with; process it in-process
+        ok, _ = _process_one(str(pdf_files[0]), str(output_dir), pretty)
+        if ok:
             success_count += 1
-            
-        except Exception as e:
-            print(f"✗ Failed to process {pdf_path.name}: {e}", file=sys.stderr)
     
     print(f"\nProcessing complete: {success_count}/{len(pdf_files)} files successful")
     
@@ -282,7 +516,7 @@ def main_cli():
         epilog="""
 Examples:
   python process_pdf.py -i document.pdf -o outline.json
-  python process_pdf.py --input report.pdf --output results.json
+  python process_pdf.py --input report.pdf --output results.json --pretty
         """
     )
     
@@ -298,6 +532,12 @@ Examples:
         help="Output JSON file path"
     )
     
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the output JSON for readability"
+    )
+    
     args = parser.parse_args()
     
     # Validate input file
@@ -320,8 +560,7 @@ Examples:
         outline = extractor.extract_outline(str(input_path))
         
         # Save to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(outline, f, indent=2, ensure_ascii=False)
+        save_outline(outline, output_path, args.pretty)
         
         print(f"✓ Outline extracted to: {output_path}")
         